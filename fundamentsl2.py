@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 import math
+import sys
+from enum import IntEnum
+from functools import lru_cache
 from typing import NamedTuple
+
+import numpy as np
 # 1.  BASELINE PARAMETERS  (Table: "Model Parameters")
 CATCHMENT_AREA_KM2      = 25          # km²  (50×50 grid, 100 m cells)
 POPULATION              = 50_000
@@ -29,13 +34,21 @@ def annual_productivity_loss(gdp_flood_zone: float,
 # ──────────────────────────────────────────────────────────────────────────────
 # 3.  NPV HELPER  —  present value of a level annual cash-flow
 # ──────────────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=256)
+def _annuity_factor(rate: float, years: float) -> float:
+    """PV of €1 per year for 'years' years: (1 - (1+rate)^-years) / rate."""
+    if rate == 0:
+        return years
+    return -math.expm1(-years * math.log1p(rate)) / rate
+
+
 def npv_annuity(annual_value: float,
                 rate: float = DISCOUNT_RATE,
                 years: int = HORIZON_YEARS) -> float:
     """PV of 'annual_value' paid at end of each year for 'years' years."""
-    if rate == 0:
-        return annual_value * years
-    return annual_value * (1 - (1 + rate) ** -years) / rate
+    if np.ndim(rate) == 0 and np.ndim(years) == 0:
+        return annual_value * _annuity_factor(rate, years)
+    return npv_annuity_batch(annual_value, rate, years)
 
 
 def npv_lump(future_value: float, year: int,
@@ -44,6 +57,29 @@ def npv_lump(future_value: float, year: int,
     return future_value / (1 + rate) ** year
 
 
+def npv_annuity_batch(annual_values: np.ndarray,
+                      rate: float | np.ndarray = DISCOUNT_RATE,
+                      years: int | np.ndarray = HORIZON_YEARS) -> np.ndarray:
+    """Array form of npv_annuity; rate and years broadcast against values."""
+    values = np.asarray(annual_values, dtype=np.float64)
+    if np.ndim(rate) == 0 and np.ndim(years) == 0:
+        return values * _annuity_factor(float(rate), float(years))
+    rate   = np.asarray(rate, dtype=np.float64)
+    years  = np.asarray(years, dtype=np.float64)
+    safe_rate = np.where(rate == 0, 1.0, rate)
+    factor = np.where(rate == 0, years,
+                      -np.expm1(-years * np.log1p(safe_rate)) / safe_rate)
+    return values * factor
+
+
+def npv_lump_batch(future_values: np.ndarray, years: int | np.ndarray,
+                   rate: float | np.ndarray = DISCOUNT_RATE) -> np.ndarray:
+    """Array form of npv_lump; years and rate broadcast against values."""
+    values = np.asarray(future_values, dtype=np.float64)
+    years  = np.asarray(years, dtype=np.float64)
+    return values / (1 + np.asarray(rate, dtype=np.float64)) ** years
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 4.  NbS UNIT SPECIFICATIONS  (Table: "NbS Unit Specifications")
 # ──────────────────────────────────────────────────────────────────────────────
@@ -83,7 +119,7 @@ class BaselineResults(NamedTuple):
     npv_damages:                 float   # € at 3 % discount
 
 
-def compute_baseline() -> BaselineResults:
+def _derive_baseline() -> BaselineResults:
     """
     Reproduce every number in the Baseline table.
     The restoration multiplier is 2.5× direct damage (stated in the report).
@@ -117,6 +153,15 @@ def compute_baseline() -> BaselineResults:
     )
 
 
+# every input is a fixed report figure, so derive once at import
+BASELINE = _derive_baseline()
+
+
+def compute_baseline() -> BaselineResults:
+    """The Baseline table (precomputed at import, see BASELINE)."""
+    return BASELINE
+
+
 def baseline_cost_breakdown(bl: BaselineResults) -> dict[str, float]:
     """Percentage shares of the 30-year undiscounted total."""
     total = bl.total_undiscounted_30yr
@@ -129,6 +174,9 @@ def baseline_cost_breakdown(bl: BaselineResults) -> dict[str, float]:
     }
 
 
+BASELINE_BREAKDOWN = baseline_cost_breakdown(BASELINE)
+
+
 def structural_liability(bl: BaselineResults) -> float:
     """Annual loss as % of total exposed assets."""
     annual_equiv = bl.npv_damages / HORIZON_YEARS          # €4.1 M
@@ -151,7 +199,23 @@ DAMAGE_TABLE = {
 }
 
 
-def flood_damage(land_use: str,
+class LandUse(IntEnum):
+    """Integer land-use codes; each value is a row index into _DMG."""
+    RESIDENTIAL    = 0
+    COMMERCIAL     = 1
+    INDUSTRIAL     = 2
+    INFRASTRUCTURE = 3
+
+
+# float64[4, 3] copy of DAMAGE_TABLE, rows ordered by LandUse
+_DMG = np.array(list(DAMAGE_TABLE.values()), dtype=np.float64)
+_LAND_USE_CODE = {name: LandUse(i) for i, name in enumerate(DAMAGE_TABLE)}
+# scalar path: one dict lookup by report name or by LandUse code
+_DAMAGE_ROWS = {**DAMAGE_TABLE,
+                **{code: DAMAGE_TABLE[name] for name, code in _LAND_USE_CODE.items()}}
+
+
+def flood_damage(land_use: str | LandUse,
                  flooded_area_m2: float,
                  depth_m: float) -> float:
     """
@@ -159,7 +223,7 @@ def flood_damage(land_use: str,
     Below 0.5 m  → linear scale from 0 at depth = 0.
     Above 1.5 m  → capped at the 1.5 m rate (conservative).
     """
-    density, pct_05, pct_15 = DAMAGE_TABLE[land_use]
+    density, pct_05, pct_15 = _DAMAGE_ROWS[land_use]
 
     if depth_m <= 0.5:
         pct = pct_05 * (depth_m / 0.5)
@@ -171,6 +235,39 @@ def flood_damage(land_use: str,
     return flooded_area_m2 * density * pct
 
 
+def _damage_pct(pct_05, pct_15, depth_m):
+    """Branchless form of the flood_damage interpolation, for arrays."""
+    pct = (pct_05 * np.minimum(depth_m, 0.5) / 0.5
+           + (pct_15 - pct_05) * np.maximum(0.0, np.minimum(depth_m, 1.5) - 0.5))
+    return np.where(np.isnan(depth_m), pct_15, pct)   # NaN takes the cap, as in flood_damage
+
+
+def flood_damage_batch(codes: np.ndarray,
+                       flooded_area_m2: np.ndarray,
+                       depth_m: np.ndarray) -> np.ndarray:
+    """
+    flood_damage over whole arrays of cells.  'codes' are LandUse values
+    (or one code for all cells); all three inputs broadcast together.
+
+    >>> codes  = np.array([[0, 1, 2, 3, 0], [3, 2, 1, 0, 1]])
+    >>> depths = np.array([[0.2, 0.5, 0.9, 1.5, 2.0], [0.1, 0.7, 1.2, 3.0, 0.4]])
+    >>> grid   = flood_damage_batch(codes, 100.0, depths)
+    >>> scalar = [[flood_damage(LandUse(c), 100.0, d) for c, d in zip(cr, dr)]
+    ...           for cr, dr in zip(codes, depths)]
+    >>> bool(np.allclose(grid, scalar))
+    True
+    >>> float(flood_damage_batch(LandUse.RESIDENTIAL, 100.0, np.nan))
+    48000.0
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    if codes.size and (codes.min() < 0 or codes.max() >= len(LandUse)):
+        raise ValueError(f"land-use codes must be in 0..{len(LandUse) - 1}")
+    row = _DMG[codes]
+    density, pct_05, pct_15 = row[..., 0], row[..., 1], row[..., 2]
+    depth = np.asarray(depth_m, dtype=np.float64)
+    return np.asarray(flooded_area_m2) * density * _damage_pct(pct_05, pct_15, depth)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 7.  PRODUCTIVITY-LOSS FUNCTIONS  (Economic Impact Functions)
 #     Tiers by flood depth
@@ -183,13 +280,28 @@ PRODUCTIVITY_TIERS = [
 ]
 
 
+# parallel-array form of the tiers; the last edge is open-ended
+_EDGES   = np.array([t[0] for t in PRODUCTIVITY_TIERS[:-1]] + [np.inf])
+_DISRUPT = np.array([t[1] for t in PRODUCTIVITY_TIERS])
+_DAYS    = np.array([t[2] for t in PRODUCTIVITY_TIERS], dtype=np.float64)
+
+
 def productivity_loss(gdp_in_zone: float, depth_m: float) -> float:
     """Annual productivity loss for one flood event of given depth."""
     for max_d, disrupt, days in PRODUCTIVITY_TIERS:
         if depth_m <= max_d:
             return gdp_in_zone * disrupt * (days / 365)
-    # fallback – should not reach here
-    return gdp_in_zone * 0.25 * (180 / 365)
+    # beyond the table (or NaN) – extreme tier
+    _, disrupt, days = PRODUCTIVITY_TIERS[-1]
+    return gdp_in_zone * disrupt * (days / 365)
+
+
+def productivity_loss_batch(gdp_in_zone: float | np.ndarray,
+                            depth_m: np.ndarray) -> np.ndarray:
+    """productivity_loss for an array of flood depths."""
+    tier = np.searchsorted(_EDGES, depth_m, side="left")
+    tier = np.minimum(tier, len(_EDGES) - 1)   # NaN sorts past np.inf
+    return np.asarray(gdp_in_zone) * _DISRUPT[tier] * (_DAYS[tier] / 365.0)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -295,13 +407,35 @@ CONFIG_HYBRID = NbSConfig(
 ALL_CONFIGS = [CONFIG_BIOSWALES, CONFIG_BUFFERS, CONFIG_WETLANDS, CONFIG_HYBRID]
 
 
+def configs_to_soa(configs: list[NbSConfig]) -> dict[str, np.ndarray]:
+    """
+    Structure-of-arrays view of the monetary fields: one float64 array per
+    NbSConfig field, row i belonging to configs[i].
+    """
+    fields = ("total_benefits_npv", "implementation_cost",
+              "maintenance_cost_npv", "net_present_value",
+              "benefit_cost_ratio")
+    return {f: np.array([getattr(c, f) for c in configs], dtype=np.float64)
+            for f in fields}
+
+
+CONFIGS_SOA = configs_to_soa(ALL_CONFIGS)
+
+
+def _derive_economics(benefits, impl_cost, maint_cost):
+    """Total cost, NPV and BCR — works on scalars and arrays alike."""
+    total_cost  = impl_cost + maint_cost
+    derived_npv = benefits - total_cost
+    derived_bcr = benefits / total_cost
+    return total_cost, derived_npv, derived_bcr
+
+
 def verify_config_economics(cfg: NbSConfig) -> dict[str, float]:
     """
     Re-derive NPV and BCR from the stated benefit / cost components.
     """
-    total_cost  = cfg.implementation_cost + cfg.maintenance_cost_npv
-    derived_npv = cfg.total_benefits_npv - total_cost
-    derived_bcr = cfg.total_benefits_npv / total_cost
+    total_cost, derived_npv, derived_bcr = _derive_economics(
+        cfg.total_benefits_npv, cfg.implementation_cost, cfg.maintenance_cost_npv)
     return {
         "total_cost_eur":   total_cost,
         "derived_npv_eur":  derived_npv,
@@ -312,11 +446,39 @@ def verify_config_economics(cfg: NbSConfig) -> dict[str, float]:
     }
 
 
+def verify_all_config_economics(configs: list[NbSConfig] | None = None
+                                ) -> list[dict[str, float]]:
+    """
+    Same as verify_config_economics, evaluated for every config in one
+    vectorised pass over a structure-of-arrays view.
+    Defaults to ALL_CONFIGS.
+    """
+    soa = configs_to_soa(ALL_CONFIGS if configs is None else configs)
+    total_cost, derived_npv, derived_bcr = _derive_economics(
+        soa["total_benefits_npv"], soa["implementation_cost"],
+        soa["maintenance_cost_npv"])
+    npv_diff = derived_npv - soa["net_present_value"]
+    columns = zip(total_cost.tolist(), derived_npv.tolist(),
+                  soa["net_present_value"].tolist(), npv_diff.tolist(),
+                  [round(bcr, 2) for bcr in derived_bcr.tolist()],
+                  soa["benefit_cost_ratio"].tolist())
+    return [
+        {
+            "total_cost_eur":   tc,
+            "derived_npv_eur":  npv,
+            "reported_npv_eur": rep_npv,
+            "npv_diff_eur":     diff,
+            "derived_bcr":      bcr,
+            "reported_bcr":     rep_bcr,
+        }
+        for tc, npv, rep_npv, diff, bcr, rep_bcr in columns
+    ]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 9.  HYBRID BUDGET BREAKDOWN
 # ──────────────────────────────────────────────────────────────────────────────
-def hybrid_budget_breakdown() -> dict[str, float]:
-    """Itemised implementation cost of the Hybrid portfolio."""
+def _derive_hybrid_budget() -> dict[str, float]:
     wetlands  = 5   * WETLAND.impl_cost_eur        # €3.75 M
     bioswales = 100 * BIOSWALE.impl_cost_eur       # €2.50 M
     buffers   = 50  * RIPARIAN.impl_cost_eur       # €1.50 M  (50 km)
@@ -330,6 +492,14 @@ def hybrid_budget_breakdown() -> dict[str, float]:
     }
 
 
+HYBRID_BUDGET = _derive_hybrid_budget()
+
+
+def hybrid_budget_breakdown() -> dict[str, float]:
+    """Itemised implementation cost of the Hybrid portfolio."""
+    return dict(HYBRID_BUDGET)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 10. CLIMATE SCENARIO ESCALATION
 #     Baseline NPV of damages under three climate futures
@@ -353,13 +523,16 @@ CLIMATE_SCENARIOS = {
 }
 
 
+# scenario axis as an array (row 0 = "Current"), so ensembles broadcast too
+CLIMATE_NPVS = np.array([data["baseline_npv_damages"] for data in CLIMATE_SCENARIOS.values()],
+                        dtype=np.float64)
+CLIMATE_MULTIPLIERS = dict(zip(CLIMATE_SCENARIOS,
+                               [round(m, 2) for m in (CLIMATE_NPVS / CLIMATE_NPVS[0]).tolist()]))
+
+
 def climate_escalation_multipliers() -> dict[str, float]:
     """Ratio of each scenario's baseline NPV to current-climate NPV."""
-    current = CLIMATE_SCENARIOS["Current"]["baseline_npv_damages"]
-    return {
-        name: round(data["baseline_npv_damages"] / current, 2)
-        for name, data in CLIMATE_SCENARIOS.items()
-    }
+    return dict(CLIMATE_MULTIPLIERS)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -383,11 +556,7 @@ INTERRUPTION_DAYS = {
 }
 
 
-def business_interruption_savings() -> dict[str, dict]:
-    """
-    Returns per-strategy breakdown.  Flags the internal inconsistency
-    found in the report.
-    """
+def _derive_interruption_savings() -> dict[str, dict]:
     results = {}
     for strategy, days in INTERRUPTION_DAYS.items():
         raw_per_firm   = DAILY_REVENUE_PER_FIRM * days          # arithmetic
@@ -405,6 +574,17 @@ def business_interruption_savings() -> dict[str, dict]:
     return results
 
 
+INTERRUPTION_SAVINGS = _derive_interruption_savings()
+
+
+def business_interruption_savings() -> dict[str, dict]:
+    """
+    Returns per-strategy breakdown.  Flags the internal inconsistency
+    found in the report.
+    """
+    return {strategy: dict(info) for strategy, info in INTERRUPTION_SAVINGS.items()}
+
+
 # --- 11b  Property-Value Protection -------------------------------------
 # "flood risk capitalisation reduces property values by 0.5–1.0 %
 #  per 1 % increase in annual flood probability"
@@ -462,14 +642,25 @@ ATTRACTIVENESS_INDEX = {
     "Hybrid Approach":          70,
 }
 
+# row 0 is the no-NbS baseline
+ATTRACTIVENESS_SCORES = np.array(list(ATTRACTIVENESS_INDEX.values()))
+ATTRACTIVENESS_DELTAS = ATTRACTIVENESS_SCORES - ATTRACTIVENESS_SCORES[0]
+
+
+def attractiveness_gains() -> dict[str, int]:
+    """Index points gained by each configuration over the baseline."""
+    return dict(zip(ATTRACTIVENESS_INDEX, ATTRACTIVENESS_DELTAS.tolist()))
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 13. MASTER COMPARISON  —  all configs + baseline on one table
 # ──────────────────────────────────────────────────────────────────────────────
-def comparison_table() -> list[dict]:
+def comparison_table(configs: list[NbSConfig] | None = None) -> list[dict]:
     """
     Mirrors "Strategic Scenario Comparison" table in the report.
+    Defaults to ALL_CONFIGS.
     """
+    configs = ALL_CONFIGS if configs is None else configs
     rows = []
     rows.append({
         "Configuration":      "Baseline (no NbS)",
@@ -479,16 +670,80 @@ def comparison_table() -> list[dict]:
         "Pollution Red. (%)":   None,
         "Resilience 1-in-50 (%)": None,
     })
-    for cfg in ALL_CONFIGS:
+    npv_m = [round(npv, 1)
+             for npv in (configs_to_soa(configs)["net_present_value"] / 1e6).tolist()]
+    for cfg, npv in zip(configs, npv_m):
         rows.append({
             "Configuration":          cfg.name,
-            "NPV (€M)":               round(cfg.net_present_value / 1e6, 1),
+            "NPV (€M)":               npv,
             "B/C Ratio":              cfg.benefit_cost_ratio,
             "Flood Reduction (%)":    cfg.flood_peak_reduction_pct,
             "Pollution Red. (%)":     cfg.pollution_reduction_pct,
             "Resilience 1-in-50 (%)": cfg.extreme_resilience_pct,
         })
     return rows
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 14. MONTE-CARLO DAMAGE SIMULATION  (illustrative exposure)
+#     Each path draws one flood depth per year; damages and productivity
+#     losses for every (path, year) are evaluated as whole arrays.
+# ──────────────────────────────────────────────────────────────────────────────
+# annual flood depth: no flood / moderate / severe / extreme event
+FLOOD_DEPTH_BINS_M = np.array([0.0, 0.3, 0.8, 2.0])
+_EVENT_SEVERITY    = np.array([0.5, 0.3, 0.2])      # share of flood years
+FLOOD_DEPTH_PROBS  = np.concatenate(([1 - BASELINE_FLOOD_PROB],
+                                     BASELINE_FLOOD_PROB * _EVENT_SEVERITY))
+
+# exposed cells (as in the damage-function examples) and GDP at risk
+SIM_LAND_USE  = np.array([LandUse.RESIDENTIAL, LandUse.COMMERCIAL,
+                          LandUse.INDUSTRIAL, LandUse.INFRASTRUCTURE])
+SIM_AREA_M2   = np.array([10_000, 5_000, 8_000, 3_000], dtype=np.float64)
+SIM_GDP_ZONE  = 500_000_000   # €500 M in flood zone (illustrative)
+
+
+class DamageSimulation(NamedTuple):
+    npv_paths:  np.ndarray    # € NPV of damages, one entry per path
+    npv_mean:   float
+    npv_p05:    float
+    npv_p50:    float
+    npv_p95:    float
+
+
+def simulate_damages(n_paths: int,
+                     rng: np.random.Generator | None = None,
+                     rate: float = DISCOUNT_RATE,
+                     years: int = HORIZON_YEARS) -> DamageSimulation:
+    """
+    NPV distribution of flood damage + productivity loss over 'years'.
+    All n_paths × years depths are drawn in one call.
+
+    >>> sim = simulate_damages(50, np.random.default_rng(7))
+    >>> depths = np.random.default_rng(7).choice(
+    ...     FLOOD_DEPTH_BINS_M, size=(50, HORIZON_YEARS), p=FLOOD_DEPTH_PROBS)
+    >>> def scalar_npv(path):             # year-by-year reference
+    ...     return sum(npv_lump(sum(flood_damage(LandUse(c), a, d)
+    ...                             for c, a in zip(SIM_LAND_USE, SIM_AREA_M2))
+    ...                         + productivity_loss(SIM_GDP_ZONE, d), year)
+    ...                for year, d in enumerate(path, 1) if d > 0)
+    >>> bool(np.allclose(sim.npv_paths, [scalar_npv(p) for p in depths.tolist()]))
+    True
+    """
+    if n_paths < 1:
+        raise ValueError(f"n_paths must be >= 1, got {n_paths}")
+    rng    = np.random.default_rng() if rng is None else rng
+    depths = rng.choice(FLOOD_DEPTH_BINS_M, size=(n_paths, years), p=FLOOD_DEPTH_PROBS)
+
+    # (n, T, 1) depths against (cells,) exposure, summed over cells
+    dmg = flood_damage_batch(SIM_LAND_USE, SIM_AREA_M2, depths[..., None]).sum(axis=-1)
+    pl  = np.where(depths > 0, productivity_loss_batch(SIM_GDP_ZONE, depths), 0.0)
+
+    discount = (1 + rate) ** -np.arange(1, years + 1)
+    npv      = (dmg + pl) @ discount
+    p05, p50, p95 = np.quantile(npv, [0.05, 0.50, 0.95]).tolist()
+    return DamageSimulation(npv, float(npv.mean()), p05, p50, p95)
+
+
 def _fmt(val, prefix="€", suffix="", decimals=2):
     """Pretty-print a number with thousand-separators."""
     if val is None:
@@ -497,198 +752,181 @@ def _fmt(val, prefix="€", suffix="", decimals=2):
     return f"{prefix}{txt}{suffix}"
 
 
+_BAR = "█" * 100          # attractiveness bars are slices of this
+
+
 def main():
     divider = "=" * 72
+    section = f"\n{divider}\n  {{}}\n{divider}\n".format
+    out: list[str] = []
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  1.  INTRODUCTORY EXPECTED ANNUAL PRODUCTIVITY LOSS")
-    print(divider)
+    out.append(section("1.  INTRODUCTORY EXPECTED ANNUAL PRODUCTIVITY LOSS"))
     loss = annual_productivity_loss(5_000_000_000, 0.05, 0.10)
-    print(f"  GDP in flood zone        : {_fmt(5_000_000_000)}")
-    print(f"  Annual flood probability : 5 %")
-    print(f"  Average impact factor    : 10 %")
-    print(f"  Expected annual loss     : {_fmt(loss)}")
+    out.append(f"  GDP in flood zone        : {_fmt(5_000_000_000)}\n")
+    out.append(f"  Annual flood probability : 5 %\n")
+    out.append(f"  Average impact factor    : 10 %\n")
+    out.append(f"  Expected annual loss     : {_fmt(loss)}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  2.  NbS UNIT COUNTS  (full €10 M budget)")
-    print(divider)
+    out.append(section("2.  NbS UNIT COUNTS  (full €10 M budget)"))
     for t in NBS_TYPES:
         n = units_from_budget(t)
-        print(f"  {t.name:<20s} : {n:>5d} units  "
-              f"(cost {_fmt(t.impl_cost_eur)} each)")
+        out.append(f"  {t.name:<20s} : {n:>5d} units  "
+                   f"(cost {_fmt(t.impl_cost_eur)} each)\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  3.  BASELINE  —  COST OF INACTION")
-    print(divider)
+    out.append(section("3.  BASELINE  —  COST OF INACTION"))
     bl = compute_baseline()
-    print(f"  Expected flood events (30 yr)     : {bl.expected_flood_events}")
-    print(f"  Cumulative direct flood damage    : {_fmt(bl.direct_flood_damage_30yr)}")
-    print(f"  Cumulative productivity losses    : {_fmt(bl.productivity_losses_30yr)}")
-    print(f"  Infrastructure restoration costs  : {_fmt(bl.restoration_costs_30yr)}  "
-          f"(2.5× direct)")
-    print(f"  Annual pollution treatment cost   : {_fmt(bl.annual_pollution_cost)} / yr")
-    print(f"  Total economic impact (30 yr)     : {_fmt(bl.total_undiscounted_30yr)}  "
-          f"(undiscounted)")
-    print(f"  NPV of damages (3 % discount)     : {_fmt(bl.npv_damages)}")
-
-    print("\n  Cost-of-Inaction Breakdown:")
-    for label, pct in baseline_cost_breakdown(bl).items():
-        print(f"    {label:<40s}: {pct:>5.1f} %")
-    print(f"\n  Structural liability (annual / assets): "
-          f"{structural_liability(bl):.2f} %")
+    out.append(f"  Expected flood events (30 yr)     : {bl.expected_flood_events}\n")
+    out.append(f"  Cumulative direct flood damage    : {_fmt(bl.direct_flood_damage_30yr)}\n")
+    out.append(f"  Cumulative productivity losses    : {_fmt(bl.productivity_losses_30yr)}\n")
+    out.append(f"  Infrastructure restoration costs  : {_fmt(bl.restoration_costs_30yr)}  "
+               f"(2.5× direct)\n")
+    out.append(f"  Annual pollution treatment cost   : {_fmt(bl.annual_pollution_cost)} / yr\n")
+    out.append(f"  Total economic impact (30 yr)     : {_fmt(bl.total_undiscounted_30yr)}  "
+               f"(undiscounted)\n")
+    out.append(f"  NPV of damages (3 % discount)     : {_fmt(bl.npv_damages)}\n")
+
+    out.append("\n  Cost-of-Inaction Breakdown:\n")
+    for label, pct in BASELINE_BREAKDOWN.items():
+        out.append(f"    {label:<40s}: {pct:>5.1f} %\n")
+    out.append(f"\n  Structural liability (annual / assets): "
+               f"{structural_liability(bl):.2f} %\n")
 
     # cross-check NPV via annuity helper
     annual_avg   = bl.total_undiscounted_30yr / HORIZON_YEARS
     npv_check    = npv_annuity(annual_avg)
-    print(f"\n  NPV cross-check (annuity on avg €{annual_avg/1e6:.2f} M / yr): "
-          f"{_fmt(npv_check)}")
+    out.append(f"\n  NPV cross-check (annuity on avg €{annual_avg/1e6:.2f} M / yr): "
+               f"{_fmt(npv_check)}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  4.  FLOOD DAMAGE FUNCTION  —  example calculations")
-    print(divider)
+    out.append(section("4.  FLOOD DAMAGE FUNCTION  —  example calculations"))
     examples = [
         ("Residential",    10_000, 0.3),
         ("Commercial",     5_000,  0.5),
         ("Industrial",     8_000,  1.0),
         ("Infrastructure", 3_000,  1.5),
     ]
-    print(f"  {'Land Use':<15s} {'Area (m²)':>10s} {'Depth (m)':>10s} "
-          f"{'Damage (€)':>14s}")
-    print(f"  {'-'*15} {'-'*10} {'-'*10} {'-'*14}")
+    out.append(f"  {'Land Use':<15s} {'Area (m²)':>10s} {'Depth (m)':>10s} "
+               f"{'Damage (€)':>14s}\n")
+    out.append(f"  {'-'*15} {'-'*10} {'-'*10} {'-'*14}\n")
     for lu, area, depth in examples:
         dmg = flood_damage(lu, area, depth)
-        print(f"  {lu:<15s} {area:>10,d} {depth:>10.1f} {_fmt(dmg):>14s}")
+        out.append(f"  {lu:<15s} {area:>10,d} {depth:>10.1f} {_fmt(dmg):>14s}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  5.  PRODUCTIVITY-LOSS FUNCTION  —  example calculations")
-    print(divider)
+    out.append(section("5.  PRODUCTIVITY-LOSS FUNCTION  —  example calculations"))
     gdp_zone = 500_000_000   # €500 M in flood zone (illustrative)
     for depth in [0.3, 0.8, 2.0]:
         pl = productivity_loss(gdp_zone, depth)
-        print(f"  Depth {depth:.1f} m  →  productivity loss : {_fmt(pl)}")
+        out.append(f"  Depth {depth:.1f} m  →  productivity loss : {_fmt(pl)}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  6.  STRATEGIC CONFIGURATIONS  —  full economics")
-    print(divider)
-    for cfg in ALL_CONFIGS:
-        v = verify_config_economics(cfg)
-        print(f"\n  ── {cfg.name} ({cfg.units_description}) ──")
-        print(f"    Flood-peak reduction        : {cfg.flood_peak_reduction_pct} %")
+    out.append(section("6.  STRATEGIC CONFIGURATIONS  —  full economics"))
+    for cfg, v in zip(ALL_CONFIGS, verify_all_config_economics()):
+        out.append(f"\n  ── {cfg.name} ({cfg.units_description}) ──\n")
+        out.append(f"    Flood-peak reduction        : {cfg.flood_peak_reduction_pct} %\n")
         if cfg.extreme_resilience_pct:
-            print(f"    Extreme-event resilience    : {cfg.extreme_resilience_pct} % "
-                  f"(1-in-50 yr peak)")
+            out.append(f"    Extreme-event resilience    : {cfg.extreme_resilience_pct} % "
+                       f"(1-in-50 yr peak)\n")
         if cfg.pollution_reduction_pct:
-            print(f"    Pollution (N) reduction     : {cfg.pollution_reduction_pct} %")
-        print(f"    Direct damage avoided (NPV) : {_fmt(cfg.direct_damage_avoided_npv)}")
-        print(f"    Productivity avoided (NPV)  : {_fmt(cfg.productivity_avoided_npv)}")
-        print(f"    Restoration avoided (NPV)   : {_fmt(cfg.restoration_avoided_npv)}")
+            out.append(f"    Pollution (N) reduction     : {cfg.pollution_reduction_pct} %\n")
+        out.append(f"    Direct damage avoided (NPV) : {_fmt(cfg.direct_damage_avoided_npv)}\n")
+        out.append(f"    Productivity avoided (NPV)  : {_fmt(cfg.productivity_avoided_npv)}\n")
+        out.append(f"    Restoration avoided (NPV)   : {_fmt(cfg.restoration_avoided_npv)}\n")
         if cfg.treatment_savings_npv:
-            print(f"    Treatment savings (NPV)     : {_fmt(cfg.treatment_savings_npv)}")
-        print(f"    ── Totals ──")
-        print(f"    Total benefits (NPV)        : {_fmt(cfg.total_benefits_npv)}")
-        print(f"    Implementation cost         : {_fmt(cfg.implementation_cost)}")
-        print(f"    Maintenance cost (NPV)      : {_fmt(cfg.maintenance_cost_npv)}")
-        print(f"    Net present value           : {_fmt(cfg.net_present_value)}  "
-              f"(reported)")
-        print(f"    NPV derived from components : {_fmt(v['derived_npv_eur'])}  "
-              f"(Δ = {_fmt(v['npv_diff_eur'])})")
-        print(f"    Benefit-cost ratio          : {cfg.benefit_cost_ratio}  "
-              f"(derived: {v['derived_bcr']})")
-        print(f"    Payback period              : {cfg.payback_years} years")
+            out.append(f"    Treatment savings (NPV)     : {_fmt(cfg.treatment_savings_npv)}\n")
+        out.append(
+            f"    ── Totals ──\n"
+            f"    Total benefits (NPV)        : {_fmt(cfg.total_benefits_npv)}\n"
+            f"    Implementation cost         : {_fmt(cfg.implementation_cost)}\n"
+            f"    Maintenance cost (NPV)      : {_fmt(cfg.maintenance_cost_npv)}\n"
+            f"    Net present value           : {_fmt(cfg.net_present_value)}  (reported)\n"
+            f"    NPV derived from components : {_fmt(v['derived_npv_eur'])}  "
+            f"(Δ = {_fmt(v['npv_diff_eur'])})\n"
+            f"    Benefit-cost ratio          : {cfg.benefit_cost_ratio}  "
+            f"(derived: {v['derived_bcr']})\n"
+            f"    Payback period              : {cfg.payback_years} years\n"
+        )
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  7.  HYBRID BUDGET BREAKDOWN")
-    print(divider)
+    out.append(section("7.  HYBRID BUDGET BREAKDOWN"))
     for label, val in hybrid_budget_breakdown().items():
-        print(f"    {label:<40s}: {_fmt(val)}")
+        out.append(f"    {label:<40s}: {_fmt(val)}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  8.  STRATEGIC SCENARIO COMPARISON TABLE")
-    print(divider)
+    out.append(section("8.  STRATEGIC SCENARIO COMPARISON TABLE"))
     hdr = (f"  {'Configuration':<25s} {'NPV (€M)':>10s} {'B/C':>6s} "
            f"{'Flood%':>7s} {'Poll%':>6s} {'Resil%':>7s}")
-    print(hdr)
-    print("  " + "-" * 68)
+    out.append(hdr + "\n")
+    out.append("  " + "-" * 68 + "\n")
     for row in comparison_table():
-        print(f"  {row['Configuration']:<25s} "
-              f"{str(row['NPV (€M)']):>10s} "
-              f"{str(row['B/C Ratio']) if row['B/C Ratio'] else '—':>6s} "
-              f"{str(row['Flood Reduction (%)']) if row['Flood Reduction (%)'] else '—':>7s} "
-              f"{str(row['Pollution Red. (%)']) if row['Pollution Red. (%)'] else '—':>6s} "
-              f"{str(row['Resilience 1-in-50 (%)']) if row['Resilience 1-in-50 (%)'] else '—':>7s}")
+        out.append(f"  {row['Configuration']:<25s} "
+                   f"{str(row['NPV (€M)']):>10s} "
+                   f"{str(row['B/C Ratio']) if row['B/C Ratio'] else '—':>6s} "
+                   f"{str(row['Flood Reduction (%)']) if row['Flood Reduction (%)'] else '—':>7s} "
+                   f"{str(row['Pollution Red. (%)']) if row['Pollution Red. (%)'] else '—':>6s} "
+                   f"{str(row['Resilience 1-in-50 (%)']) if row['Resilience 1-in-50 (%)'] else '—':>7s}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  9.  CLIMATE SCENARIO ESCALATION")
-    print(divider)
-    print(f"  {'Scenario':<22s} {'Precip ×':>9s} {'Freq ×':>8s} "
-          f"{'Baseline NPV Damages':>22s} {'Multiplier':>11s}")
-    print("  " + "-" * 75)
+    out.append(section("9.  CLIMATE SCENARIO ESCALATION"))
+    out.append(f"  {'Scenario':<22s} {'Precip ×':>9s} {'Freq ×':>8s} "
+               f"{'Baseline NPV Damages':>22s} {'Multiplier':>11s}\n")
+    out.append("  " + "-" * 75 + "\n")
     mults = climate_escalation_multipliers()
     for name, data in CLIMATE_SCENARIOS.items():
-        print(f"  {name:<22s} {data['precip_intensity_factor']:>9.2f} "
-              f"{data['event_freq_factor']:>8.3f} "
-              f"{_fmt(data['baseline_npv_damages']):>22s} "
-              f"{mults[name]:>10.2f}×")
+        out.append(f"  {name:<22s} {data['precip_intensity_factor']:>9.2f} "
+                   f"{data['event_freq_factor']:>8.3f} "
+                   f"{_fmt(data['baseline_npv_damages']):>22s} "
+                   f"{mults[name]:>10.2f}×\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  10. TERRITORIAL COMPETITIVENESS")
-    print(divider)
+    out.append(section("10. TERRITORIAL COMPETITIVENESS"))
 
-    print("\n  (a) Business-Interruption Savings")
+    out.append("\n  (a) Business-Interruption Savings\n")
     for strat, info in business_interruption_savings().items():
-        print(f"\n    {strat}:")
-        print(f"      Days avoided / year              : {info['days_avoided_per_year']}")
-        print(f"      Computed per firm (raw arith.)   : {_fmt(info['computed_per_firm_eur'])}")
-        print(f"      Reported per firm                : {_fmt(info['reported_per_firm_eur'])}")
-        print(f"      Reported total annual            : {_fmt(info['reported_total_annual_eur'])}")
+        out.append(f"\n    {strat}:\n")
+        out.append(f"      Days avoided / year              : {info['days_avoided_per_year']}\n")
+        out.append(f"      Computed per firm (raw arith.)   : {_fmt(info['computed_per_firm_eur'])}\n")
+        out.append(f"      Reported per firm                : {_fmt(info['reported_per_firm_eur'])}\n")
+        out.append(f"      Reported total annual            : {_fmt(info['reported_total_annual_eur'])}\n")
         
 
-    print("\n  (b) Property-Value Protection  (Strategic Wetlands)")
+    out.append("\n  (b) Property-Value Protection  (Strategic Wetlands)\n")
     pvp = property_value_protection()
-    print(f"      Flood-prob reduction                : {pvp['flood_prob_reduction_pp']} pp")
-    print(f"      Protected value (low / high)        : "
-          f"{_fmt(pvp['property_value_protected_low_eur'])} – "
-          f"{_fmt(pvp['property_value_protected_high_eur'])}")
-    print(f"      Report range                        : {pvp['report_range']}")
+    out.append(f"      Flood-prob reduction                : {pvp['flood_prob_reduction_pp']} pp\n")
+    out.append(f"      Protected value (low / high)        : "
+               f"{_fmt(pvp['property_value_protected_low_eur'])} – "
+               f"{_fmt(pvp['property_value_protected_high_eur'])}\n")
+    out.append(f"      Report range                        : {pvp['report_range']}\n")
 
-    print("\n  (c) Insurance-Premium Savings")
+    out.append("\n  (c) Insurance-Premium Savings\n")
     ips = insurance_premium_savings()
-    print(f"      Properties                          : {ips['properties']:,}")
-    print(f"      Saving / property / yr (low–high)   : "
-          f"{_fmt(ips['saving_per_property_low'])} – "
-          f"{_fmt(ips['saving_per_property_high'])}")
-    print(f"      Total annual savings (low–high)     : "
-          f"{_fmt(ips['total_annual_low_eur'])} – "
-          f"{_fmt(ips['total_annual_high_eur'])}")
+    out.append(f"      Properties                          : {ips['properties']:,}\n")
+    out.append(f"      Saving / property / yr (low–high)   : "
+               f"{_fmt(ips['saving_per_property_low'])} – "
+               f"{_fmt(ips['saving_per_property_high'])}\n")
+    out.append(f"      Total annual savings (low–high)     : "
+               f"{_fmt(ips['total_annual_low_eur'])} – "
+               f"{_fmt(ips['total_annual_high_eur'])}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  11. TERRITORIAL ATTRACTIVENESS INDEX  (0-100)")
-    print(divider)
+    out.append(section("11. TERRITORIAL ATTRACTIVENESS INDEX  (0-100)"))
     for label, score in ATTRACTIVENESS_INDEX.items():
-        bar = "█" * score
-        print(f"    {label:<28s} : {score:>3d}  {bar}")
+        bar = _BAR[:score]
+        out.append(f"    {label:<28s} : {score:>3d}  {bar}\n")
 
     # ------------------------------------------------------------------
-    print(f"\n{divider}")
-    print("  12. RANKING BY NET PRESENT VALUE")
-    print(divider)
+    out.append(section("12. RANKING BY NET PRESENT VALUE"))
     ranked = sorted(ALL_CONFIGS, key=lambda c: c.net_present_value, reverse=True)
     for rank, cfg in enumerate(ranked, 1):
-        print(f"    {rank}.  {cfg.name:<30s} NPV = {_fmt(cfg.net_present_value)}   "
-              f"BCR = {cfg.benefit_cost_ratio}")
+        out.append(f"    {rank}.  {cfg.name:<30s} NPV = {_fmt(cfg.net_present_value)}   "
+                   f"BCR = {cfg.benefit_cost_ratio}\n")
+
+    out.append(f"\n{divider}\n\n")
 
-    print(f"\n{divider}\n")
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":